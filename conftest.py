@@ -0,0 +1,30 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# server resolves TEMP_DIR at import, so HOME must point at a scratch dir first
+_HOME = tempfile.mkdtemp(prefix="linky-home-")
+os.environ["HOME"] = _HOME
+
+import server  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_temp_dir():
+    # Each test runs on its own event loop, so give it fresh loop-bound singletons
+    server._INFLIGHT.clear()
+    server._watcher = server._TempDirWatcher(server.TEMP_DIR)
+    server._query_index = server._QueryIndex(server._INDEX_PATH)
+    server._watcher.add_listener(server._query_index)
+    for name in os.listdir(server.TEMP_DIR):
+        path = os.path.join(server.TEMP_DIR, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        # The index reconciles its rows on first use, so the database can stay
+        elif path != server._INDEX_PATH:
+            os.remove(path)
+    server._PROFILE_CACHE.clear()
+    server._NEGATIVE.clear()
+    yield
@@ -4,10 +4,51 @@ import os
 import asyncio
 import urllib.parse
 import glob
+import contextlib
+import logging
+import stat
+import functools
+import time
+from collections import OrderedDict
+import aiofiles
+import aiosqlite
+from typing import Any, Protocol
+from watchfiles import awatch, Change
 
 # Initialize FastMCP server
 mcp = FastMCP("linky")
 
+logger = logging.getLogger(__name__)
+
+# Directory the browser addon writes scraped profiles and searches into
+TEMP_DIR = os.path.expanduser("~/Desktop/temp")
+os.makedirs(TEMP_DIR, exist_ok=True)
+
+# LinkedIn URL templates, bound once
+_PROFILE_URL = "https://www.linkedin.com/in/{}".format
+_SEARCH_URL = "https://www.linkedin.com/search/results/people/?keywords={}&sid=qAl".format
+
+# Complete file contents keyed by path, stored as (st_mtime_ns, st_size,
+# min_lines satisfied, content) and valid while the stat fields match
+_PROFILE_CACHE: OrderedDict[str, tuple[int, int, int, str]] = OrderedDict()
+_PROFILE_CACHE_SIZE = 256
+
+# Prefix size read to decide whether a file has enough lines
+_HEAD_BYTES = 65536
+
+_REMOVE_BATCH_SIZE = 64
+
+# Seconds the temp-dir watcher keeps its OS watch open with nothing using it
+_WATCHER_IDLE = 60.0
+
+# Files that recently timed out, mapped to the monotonic time their entry expires
+_NEGATIVE: OrderedDict[str, float] = OrderedDict()
+_NEGATIVE_TTL = 30.0
+_NEGATIVE_SIZE = 1024
+
+# Browser-open-and-wait attempts in progress, keyed by the file they wait for
+_INFLIGHT: dict[str, asyncio.Future[str]] = {}
+
 
 @mcp.tool()
 async def ping() -> str:
@@ -17,21 +58,467 @@ async def ping() -> str:
     return "hello Pong!!!"
 
 
-async def wait_for_file(file_path: str, min_lines: int, max_wait: int) -> str:
-    """Wait for a file to exist and have at least min_lines, up to max_wait seconds."""
-    waited = 0
-    while waited < max_wait:
-        await asyncio.sleep(1)
-        waited += 1
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                result = f.read()
-                if len(result.strip().splitlines()) < min_lines:
+@functools.lru_cache(maxsize=4096)
+def _quote(s: str) -> str:
+    return urllib.parse.quote(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _unquote(s: str) -> str:
+    return urllib.parse.unquote(s)
+
+
+def _universal_newlines(data: bytes) -> bytes:
+    """Translate \r\n and bare \r to \n, as text-mode reads do."""
+    if b"\r" not in data:
+        return data
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _has_at_least_n_lines(data: str | bytes, n: int) -> bool:
+    """Equivalent to len(data.strip().splitlines()) >= n when "\n" is the only line break, stopping after n lines."""
+    newline = "\n" if isinstance(data, str) else b"\n"
+    end = len(data)
+    while end and data[end - 1 : end].isspace():
+        end -= 1
+    start = 0
+    while start < end and data[start : start + 1].isspace():
+        start += 1
+    if start == end:
+        return n <= 0
+    count = 1
+    i = start
+    while count < n:
+        i = data.find(newline, i, end)
+        if i < 0:
+            return False
+        count += 1
+        i += 1
+    return True
+
+
+async def _read_if_complete(file_path: str, min_lines: int) -> str | None:
+    """Return the file content if it exists and has at least min_lines, else None."""
+    try:
+        st = await asyncio.to_thread(os.stat, file_path)
+    except OSError:
+        return None
+    cached = _PROFILE_CACHE.get(file_path)
+    if (
+        cached is not None
+        and cached[:2] == (st.st_mtime_ns, st.st_size)
+        and cached[2] >= min_lines
+    ):
+        _PROFILE_CACHE.move_to_end(file_path)
+        return cached[3]
+    async with aiofiles.open(file_path, "rb") as f:
+        # Decide completeness from a bounded prefix; only complete files are read in full
+        head = await f.read(_HEAD_BYTES)
+        # A trailing \r may be half of a \r\n split by the read, so leave it out
+        # of the prefix check; it is trailing whitespace otherwise
+        prefix = head[:-1] if head.endswith(b"\r") else head
+        complete = _has_at_least_n_lines(_universal_newlines(prefix), min_lines)
+        if not complete and len(head) < _HEAD_BYTES:
+            return None
+        data = _universal_newlines(head + await f.read())
+    if not complete and not _has_at_least_n_lines(data, min_lines):
+        return None
+    _NEGATIVE.pop(file_path, None)
+    result = data.decode("utf-8")
+    _PROFILE_CACHE[file_path] = (st.st_mtime_ns, st.st_size, min_lines, result)
+    _PROFILE_CACHE.move_to_end(file_path)
+    if len(_PROFILE_CACHE) > _PROFILE_CACHE_SIZE:
+        _PROFILE_CACHE.popitem(last=False)
+    return result
+
+
+class _WatchListener(Protocol):
+    """Receives _TempDirWatcher notifications, in order, outside the dispatch loop."""
+
+    async def apply(self, changes: set[tuple[Change, str]]) -> None:
+        """Handle a non-empty batch of changes."""
+
+    async def watching(self) -> None:
+        """Handle the OS watch becoming active, once per watcher task."""
+
+    async def close(self) -> None:
+        """Handle the watcher stopping; called from the watcher task."""
+
+
+# Queued for listeners once the OS watch is active
+_WATCHING = object()
+
+
+class _TempDirWatcher:
+    """A single watchfiles subscription on a directory, fanned out to per-path waiters and listeners."""
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._listeners: list[_WatchListener] = []
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self._last_used = 0.0
+
+    def start(self) -> asyncio.Task:
+        """Start the watcher if needed and return its task."""
+        self._last_used = time.monotonic()
+        if self._task is None or self._task.done() or self._stop.is_set():
+            self._stop = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._stop))
+            self._task.add_done_callback(_log_watcher_exit)
+        return self._task
+
+    def add_listener(self, listener: _WatchListener) -> None:
+        """Deliver this watcher's changes, watch start and stop to listener."""
+        self._listeners.append(listener)
+
+    def register(self, path: str) -> asyncio.Event:
+        """Return an event that is set whenever path may have changed, starting the watcher lazily."""
+        self.start()
+        event = asyncio.Event()
+        self._waiters.setdefault(path, set()).add(event)
+        return event
+
+    def unregister(self, path: str, event: asyncio.Event) -> None:
+        waiters = self._waiters.get(path)
+        if waiters is None:
+            return
+        waiters.discard(event)
+        if not waiters:
+            del self._waiters[path]
+
+    async def _run(self, stop: asyncio.Event) -> None:
+        # Listeners run on their own task so slow ones don't delay waking waiters
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        notifier = asyncio.create_task(self._notify(queue))
+        try:
+            # The directory is only created at import; recreate it if it was removed since
+            await asyncio.to_thread(os.makedirs, self._directory, exist_ok=True)
+            # yield_on_timeout wakes every waiter once a second, covering a file
+            # written before the OS watch was established
+            watching = False
+            async for changes in awatch(
+                self._directory,
+                stop_event=stop,
+                debounce=50,
+                rust_timeout=1000,
+                yield_on_timeout=True,
+            ):
+                # The first yield means the OS watch is in place; anything written
+                # before that was only visible to a scan
+                if not watching:
+                    watching = True
+                    if self._listeners:
+                        queue.put_nowait(_WATCHING)
+                if changes:
+                    woken = [
+                        self._waiters.get(path, ())
+                        for change, path in changes
+                        if change in (Change.added, Change.modified)
+                    ]
+                    if self._listeners:
+                        queue.put_nowait(changes)
+                else:
+                    woken = list(self._waiters.values())
+                    # Release the OS watch once nothing has used it for a while
+                    if not self._waiters and time.monotonic() - self._last_used > _WATCHER_IDLE:
+                        stop.set()
+                for events in woken:
+                    for event in events:
+                        event.set()
+        finally:
+            queue.put_nowait(None)
+            try:
+                await notifier
+            finally:
+                for listener in self._listeners:
+                    await listener.close()
+
+    async def _notify(self, queue: asyncio.Queue[Any]) -> None:
+        while (item := await queue.get()) is not None:
+            for listener in self._listeners:
+                if item is _WATCHING:
+                    await listener.watching()
+                else:
+                    await listener.apply(item)
+
+
+def _log_watcher_exit(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Temp dir watcher stopped", exc_info=task.exception())
+
+
+_watcher = _TempDirWatcher(TEMP_DIR)
+
+
+def _stat_search_file(name: str) -> int | None:
+    """Return the mtime of a cached search file in TEMP_DIR, or None if it is not one."""
+    # Like glob, skip hidden files; this also skips the index database itself
+    if name.startswith(".") or not name.endswith(".txt"):
+        return None
+    try:
+        st = os.stat(os.path.join(TEMP_DIR, name), follow_symlinks=False)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st.st_mtime_ns
+
+
+def _scan_search_files() -> list[tuple[str, int]]:
+    """Return (filename, mtime_ns) for every cached search file in TEMP_DIR."""
+    entries = []
+    with os.scandir(TEMP_DIR) as it:
+        for entry in it:
+            name = entry.name
+            # Like glob, skip hidden files
+            if name.startswith(".") or not name.endswith(".txt"):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
                     continue
+                # DirEntry caches its stat, so each file costs at most one syscall
+                mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+            except OSError:
+                continue
+            entries.append((name, mtime_ns))
+    return entries
+
+
+class _QueryIndex:
+    """SQLite index of cached search files, kept current by the temp-dir watcher."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._db: aiosqlite.Connection | None = None
+        # Watcher task whose events keep the index current; once it stops,
+        # the next listing reconciles against the directory
+        self._synced_task: asyncio.Task | None = None
+        # Serializes reconciles against event updates, so a rescan can't
+        # overwrite changes that arrived while it was scanning
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _rows(entries: list[tuple[str, int]]) -> list[tuple[str, str, int]]:
+        rows = []
+        for name, mtime_ns in entries:
+            try:
+                rows.append((name, _unquote(name[:-4]), mtime_ns))
+            except Exception:
+                pass
+        return rows
+
+    async def _connect(self) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(self._path)
+        try:
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "filename TEXT PRIMARY KEY, decoded_query TEXT NOT NULL, mtime INTEGER NOT NULL)"
+            )
+            await db.execute("CREATE INDEX IF NOT EXISTS cache_mtime ON cache (mtime)")
+            await db.commit()
+        except BaseException:
+            await db.close()
+            raise
+        return db
+
+    async def _reconcile(self, db: aiosqlite.Connection) -> None:
+        """Diff TEMP_DIR against the stored rows, writing only what changed."""
+        entries = dict(await asyncio.to_thread(_scan_search_files))
+        async with db.execute("SELECT filename, mtime FROM cache") as cursor:
+            indexed = dict(await cursor.fetchall())
+        stale = [(name,) for name in indexed if name not in entries]
+        fresh = self._rows(
+            [(name, mtime) for name, mtime in entries.items() if indexed.get(name) != mtime]
+        )
+        if not stale and not fresh:
+            return
+        await db.executemany("DELETE FROM cache WHERE filename = ?", stale)
+        await db.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", fresh)
+        await db.commit()
+
+    async def _sync(self) -> aiosqlite.Connection:
+        """Return the connection, reconciling if the index may have missed events. Call with the lock held."""
+        task = _watcher.start()
+        if self._db is not None and self._synced_task is task:
+            return self._db
+        try:
+            if self._db is None:
+                self._db = await self._connect()
+            await self._reconcile(self._db)
+        except BaseException:
+            await self._close()
+            raise
+        self._synced_task = task
+        return self._db
+
+    async def _close(self) -> None:
+        db, self._db, self._synced_task = self._db, None, None
+        if db is not None:
+            await db.close()
+
+    async def apply(self, changes: set[tuple[Change, str]]) -> None:
+        """Bring the rows for changed search files in line with the filesystem."""
+        names = {
+            os.path.basename(path)
+            for _, path in changes
+            if os.path.dirname(path) == TEMP_DIR and path.endswith(".txt")
+        }
+        if not names:
+            return
+
+        def stat_all() -> tuple[list[tuple[str, int]], list[str]]:
+            present, missing = [], []
+            for name in names:
+                mtime_ns = _stat_search_file(name)
+                if mtime_ns is None:
+                    missing.append(name)
+                else:
+                    present.append((name, mtime_ns))
+            return present, missing
+
+        async with self._lock:
+            # Not reconciled yet; the first listing will scan anyway
+            if self._db is None:
+                return
+            try:
+                present, missing = await asyncio.to_thread(stat_all)
+                await self._db.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", self._rows(present)
+                )
+                await self._db.executemany(
+                    "DELETE FROM cache WHERE filename = ?", [(name,) for name in missing]
+                )
+                await self._db.commit()
+            except Exception:
+                # Fall back to a reconcile on the next listing
+                await self._close()
+
+    async def watching(self) -> None:
+        """Reconcile again once the OS watch is active, catching files written while it was starting."""
+        async with self._lock:
+            if self._db is None:
+                return
+            try:
+                await self._reconcile(self._db)
+            except Exception:
+                await self._close()
+
+    async def page(self, offset: int, limit: int) -> list[str]:
+        """Return decoded queries, most recently modified first."""
+        async with self._lock:
+            db = await self._sync()
+            async with db.execute(
+                "SELECT decoded_query FROM cache ORDER BY mtime DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            ) as cursor:
+                return [row[0] for row in await cursor.fetchall()]
+
+    async def close(self) -> None:
+        """Called from the watcher task as it stops; without its events the next listing must reconcile."""
+        async with self._lock:
+            if self._synced_task is asyncio.current_task():
+                await self._close()
+
+    async def clear(self) -> None:
+        async with self._lock:
+            if self._db is None:
+                return
+            try:
+                await self._db.execute("DELETE FROM cache")
+                await self._db.commit()
+            except Exception:
+                # The next listing reconciles against whatever is left on disk
+                await self._close()
+
+
+# Hidden, so clear_temp_cache's glob leaves it in place
+_INDEX_PATH = os.path.join(TEMP_DIR, ".cache_index.sqlite")
+_query_index = _QueryIndex(_INDEX_PATH)
+_watcher.add_listener(_query_index)
+
+
+async def wait_for_file(file_path: str, min_lines: int, max_wait: int) -> str:
+    """Wait for a file in TEMP_DIR to exist and have at least min_lines, up to max_wait seconds."""
+    # Cache hits never start a watcher
+    result = await _read_if_complete(file_path, min_lines)
+    if result is not None:
+        return result
+
+    event = _watcher.register(file_path)
+
+    async def watch() -> str:
+        while True:
+            # Registered before this check, so a write racing it still sets the event.
+            # _read_if_complete only reads a bounded prefix, so a full re-check per
+            # wake stays cheap and also catches files overwritten or replaced in place.
+            result = await _read_if_complete(file_path, min_lines)
+            if result is not None:
                 return result
+            # Bounded so a dead or blind watcher degrades to a once-a-second re-check
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(event.wait(), 1.0)
+            event.clear()
+
+    try:
+        return await asyncio.wait_for(watch(), timeout=max_wait)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        _watcher.unregister(file_path, event)
+    # Let repeated calls fail fast instead of opening the browser and waiting again
+    _NEGATIVE[file_path] = time.monotonic() + _NEGATIVE_TTL
+    _NEGATIVE.move_to_end(file_path)
+    if len(_NEGATIVE) > _NEGATIVE_SIZE:
+        _NEGATIVE.popitem(last=False)
     return f"File not found or incomplete after {max_wait} seconds. file_path: {file_path}. Consider broadening your search query, as it may have returned no results."
 
 
+async def open_and_wait_for_file(
+    url: str, file_path: str, min_lines: int, max_wait: int
+) -> str:
+    """Open url in a new browser window and wait for its file, sharing one attempt among concurrent callers."""
+    fut = _INFLIGHT.get(file_path)
+    if fut is None:
+        expires = _NEGATIVE.get(file_path)
+        if expires is not None:
+            remaining = expires - time.monotonic()
+            if remaining > 0:
+                return f"File not found or incomplete in a recent attempt; retry in {remaining:.0f} seconds. file_path: {file_path}. Consider broadening your search query, as it may have returned no results."
+            del _NEGATIVE[file_path]
+
+        async def open_and_wait() -> str:
+            webbrowser.open_new(url)
+            return await wait_for_file(file_path, min_lines, max_wait)
+
+        fut = asyncio.ensure_future(open_and_wait())
+        _INFLIGHT[file_path] = fut
+
+        def forget(done: asyncio.Future[str]) -> None:
+            if _INFLIGHT.get(file_path) is done:
+                del _INFLIGHT[file_path]
+
+        fut.add_done_callback(forget)
+    # Shielded so one caller giving up doesn't cancel the wait for the others
+    return await asyncio.shield(fut)
+
+
+async def wait_for_profile_file(handle: str) -> tuple[str, str]:
+    """
+    Open the LinkedIn profile for a handle unless its file is already complete, then wait for the file.
+    Returns a tuple of (handle, result or error message).
+    """
+    file_path = os.path.join(TEMP_DIR, f"{handle}.md")
+    # Check for file before opening the URL
+    result = await _read_if_complete(file_path, min_lines=20)
+    if result is not None:
+        return handle, result
+    url = _PROFILE_URL(handle)
+    result = await open_and_wait_for_file(url, file_path, min_lines=20, max_wait=10)
+    return handle, result
+
+
 @mcp.tool()
 async def scrape_linkedin_profile(handle: str) -> str:
     """
@@ -49,17 +536,11 @@ async def scrape_linkedin_profile(handle: str) -> str:
         - Relies on a browser addon to create the file in the expected location.
         - The file must contain at least 20 lines to be considered complete.
         - The tool will open a new browser window if the file is missing or incomplete.
+        - Concurrent calls for the same handle share a single browser window and wait.
+        - After a timeout, calls for the same handle return an error immediately for 30 seconds unless the file appears.
     """
-    file_path = os.path.expanduser(f"~/Desktop/temp/{handle}.md")
-    # Check for file before opening the URL
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            result = f.read()
-            if len(result.strip().splitlines()) >= 20:
-                return result
-    url = f"https://www.linkedin.com/in/{handle}"
-    webbrowser.open_new(url)
-    return await wait_for_file(file_path, min_lines=20, max_wait=10)
+    _, result = await wait_for_profile_file(handle)
+    return result
 
 
 @mcp.tool()
@@ -84,25 +565,22 @@ async def search_linkedin_people(query: str, page: int = 1) -> str:
         - Relies on a browser addon to create the file in the expected location.
         - The file must contain at least 2 lines to be considered complete.
         - The tool will open a new browser window if the file is missing or incomplete.
+        - Concurrent calls for the same query and page share a single browser window and wait.
+        - After a timeout, calls for the same query and page return an error immediately for 30 seconds unless the file appears.
         - The filename follows the pattern: <encoded_query>_page<page>.txt
         - The 'page' query parameter is only included in the URL if page > 1.
     """
-    encoded_query = urllib.parse.quote(query)
+    encoded_query = _quote(query)
     filename = f"{encoded_query}_page{page}.txt" if query else "search.txt"
-    file_path = os.path.expanduser(f"~/Desktop/temp/{filename}")
+    file_path = os.path.join(TEMP_DIR, filename)
     # Check for file before opening the URL
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            result = f.read()
-            if len(result.strip().splitlines()) >= 2:
-                return result
-    base_url = f"https://www.linkedin.com/search/results/people/?keywords={encoded_query}&sid=qAl"
+    result = await _read_if_complete(file_path, min_lines=2)
+    if result is not None:
+        return result
+    url = _SEARCH_URL(encoded_query)
     if page > 1:
-        url = f"{base_url}&page={page}"
-    else:
-        url = base_url
-    webbrowser.open_new(url)
-    return await wait_for_file(file_path, min_lines=2, max_wait=20)
+        url += f"&page={page}"
+    return await open_and_wait_for_file(url, file_path, min_lines=2, max_wait=20)
 
 
 @mcp.tool()
@@ -118,17 +596,27 @@ async def clear_temp_cache() -> str:
     Caveats:
         - Only files in the ~/Desktop/temp directory are deleted; subdirectories are not affected.
         - Any cached data in this directory will be lost after running this tool.
+        - The hidden search index file (.cache_index.sqlite) is emptied rather than deleted.
+        - Recent timeouts are forgotten, so the next scrape or search opens the browser again.
     """
-    temp_dir = os.path.expanduser("~/Desktop/temp")
-    files = glob.glob(os.path.join(temp_dir, "*"))
-    deleted = 0
-    for f in files:
+    files = await asyncio.to_thread(glob.glob, os.path.join(TEMP_DIR, "*"))
+
+    def remove(path: str) -> int:
         try:
-            os.remove(f)
-            deleted += 1
-        except Exception as e:
-            pass
-    return f"Deleted {deleted} files from {temp_dir}."
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+    deleted = 0
+    # Batch removals so a large cache doesn't flood the default thread pool
+    for i in range(0, len(files), _REMOVE_BATCH_SIZE):
+        batch = files[i : i + _REMOVE_BATCH_SIZE]
+        counts = await asyncio.gather(*(asyncio.to_thread(remove, f) for f in batch))
+        deleted += sum(counts)
+    _NEGATIVE.clear()
+    await _query_index.clear()
+    return f"Deleted {deleted} files from {TEMP_DIR}."
 
 
 @mcp.tool()
@@ -136,7 +624,8 @@ async def list_linkedin_search_queries(page: int = 1, page_size: int = 10) -> li
     """
     Return a paginated list of queries of previous LinkedIn people searches based on .txt files in the temp dir.
 
-    This tool scans the ~/Desktop/temp directory for files ending with .txt, which are assumed to be the cached results of LinkedIn people searches.
+    This tool reads an index of the ~/Desktop/temp directory's files ending with .txt, which are assumed to be the cached results of LinkedIn people searches.
+    The index is a SQLite database kept up to date by a directory watcher. While the watcher runs, listing does not rescan the directory; after it has stopped for being idle, the next listing re-checks the directory against the index and writes only the rows that changed.
     It extracts the base filename (removing the .txt extension), URL-decodes it to recover the original search query, and returns a paginated list of all such queries.
 
     Args:
@@ -150,48 +639,13 @@ async def list_linkedin_search_queries(page: int = 1, page_size: int = 10) -> li
         - Only files ending in .txt are considered, and the filename (before .txt) is expected to be a URL-encoded query string.
         - If a filename cannot be URL-decoded, it is skipped.
         - The tool does not check the contents of the files, only their names.
-        - The returned queries are not sorted or deduplicated.
+        - The returned queries are sorted by most recently modified first and are not deduplicated.
         - Pagination is 1-based; if the page is out of range, an empty list is returned.
     """
-    temp_dir = os.path.expanduser("~/Desktop/temp")
-    txt_files = glob.glob(os.path.join(temp_dir, "*.txt"))
-    queries = []
-    for f in txt_files:
-        base = os.path.basename(f)
-        if base.endswith(".txt"):
-            encoded_query = base[:-4]
-            try:
-                query = urllib.parse.unquote(encoded_query)
-                queries.append(query)
-            except Exception:
-                pass
     # Pagination
-    start = (page - 1) * page_size
-    end = start + page_size
-    return queries[start:end]
-
-
-async def wait_for_profile_file(handle: str) -> tuple[str, str]:
-    """
-    Wait for the LinkedIn profile file for a given handle to appear and be complete.
-    Returns a tuple of (handle, result or error message).
-    """
-    file_path = os.path.expanduser(f"~/Desktop/temp/{handle}.md")
-    max_wait = 10
-    waited = 0
-    while waited < max_wait:
-        await asyncio.sleep(1)
-        waited += 1
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                result = f.read()
-                if len(result.strip().splitlines()) < 20:
-                    continue
-                return handle, result
-    return (
-        handle,
-        f"Error: File {file_path} not found or not complete after {max_wait} seconds.",
-    )
+    if page < 1 or page_size < 1:
+        return []
+    return await _query_index.page((page - 1) * page_size, page_size)
 
 
 @mcp.tool()
@@ -213,23 +667,8 @@ async def scrape_multiple_linkedin_profiles(handles: list[str]) -> dict:
         - The tool will open a new browser window for each handle only if the file is missing or incomplete.
         - All file waits are performed concurrently for efficiency.
     """
-    results: dict[str, str] = {}
-    to_open = []
-    for handle in handles:
-        file_path = os.path.expanduser(f"~/Desktop/temp/{handle}.md")
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                result = f.read()
-                if len(result.strip().splitlines()) >= 20:
-                    results[handle] = result
-                    continue
-        to_open.append(handle)
-        url = f"https://www.linkedin.com/in/{handle}"
-        webbrowser.open_new(url)
-    tasks = [wait_for_profile_file(handle) for handle in to_open]
-    results_list = await asyncio.gather(*tasks)
-    results.update({handle: result for handle, result in results_list})
-    return results
+    results = await asyncio.gather(*(wait_for_profile_file(h) for h in handles))
+    return dict(results)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+import server
+
+
+def write_search(query, page=1, mtime=None):
+    path = os.path.join(server.TEMP_DIR, f"{server._quote(query)}_page{page}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("result 1\nresult 2\n")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+async def wait_for_listing(expected, page_size=10):
+    # The index picks up file events asynchronously, after the watcher's debounce
+    for _ in range(50):
+        queries = await server.list_linkedin_search_queries(1, page_size)
+        if queries == expected:
+            return queries
+        await asyncio.sleep(0.1)
+    return queries
+
+
+@pytest.mark.asyncio
+async def test_list_linkedin_search_queries_newest_first_and_paginated():
+    now = time.time()
+    write_search("python developer", mtime=now - 30)
+    write_search("rust engineer", mtime=now - 20)
+    write_search("data scientist", mtime=now - 10)
+    assert await server.list_linkedin_search_queries(1, 2) == [
+        "data scientist_page1",
+        "rust engineer_page1",
+    ]
+    assert await server.list_linkedin_search_queries(2, 2) == ["python developer_page1"]
+    assert await server.list_linkedin_search_queries(3, 2) == []
+
+
+@pytest.mark.asyncio
+async def test_list_linkedin_search_queries_follows_creates_and_deletes():
+    write_search("python developer", mtime=time.time() - 10)
+    assert await server.list_linkedin_search_queries() == ["python developer_page1"]
+    path = write_search("rust engineer")
+    assert await wait_for_listing(["rust engineer_page1", "python developer_page1"]) == [
+        "rust engineer_page1",
+        "python developer_page1",
+    ]
+    os.remove(path)
+    assert await wait_for_listing(["python developer_page1"]) == ["python developer_page1"]
+
+
+@pytest.mark.asyncio
+async def test_list_linkedin_search_queries_keeps_files_created_during_rescan(
+    monkeypatch,
+):
+    scan = server._scan_search_files
+
+    def scan_then_create():
+        entries = scan()
+        # Lands after the snapshot; give its event time to reach the index
+        write_search("rust engineer")
+        time.sleep(0.5)
+        return entries
+
+    monkeypatch.setattr(server, "_scan_search_files", scan_then_create)
+    # Start the watcher before the rescan, as a prior wait would have
+    server._watcher.start()
+    await asyncio.sleep(0.2)
+    assert await server.list_linkedin_search_queries() == []
+    assert await wait_for_listing(["rust engineer_page1"]) == ["rust engineer_page1"]
+
+
+@pytest.mark.asyncio
+async def test_list_linkedin_search_queries_catches_files_created_before_watch_starts(
+    monkeypatch,
+):
+    awatch = server.awatch
+
+    async def slow_awatch(*args, **kwargs):
+        # Hold off the OS watch so the file below is written before it exists
+        await asyncio.sleep(0.5)
+        async for changes in awatch(*args, **kwargs):
+            yield changes
+
+    monkeypatch.setattr(server, "awatch", slow_awatch)
+    assert await server.list_linkedin_search_queries() == []
+    write_search("rust engineer")
+    assert await wait_for_listing(["rust engineer_page1"]) == ["rust engineer_page1"]
+
+
+@pytest.mark.asyncio
+async def test_list_linkedin_search_queries_restart_writes_only_changes(monkeypatch):
+    monkeypatch.setattr(server, "_WATCHER_IDLE", 0.0)
+    write_search("python developer")
+    assert await server.list_linkedin_search_queries() == ["python developer_page1"]
+    await asyncio.wait_for(server._watcher.start(), 5)
+
+    rows = server._QueryIndex._rows
+    written = []
+
+    def spy(entries):
+        written.extend(entries)
+        return rows(entries)
+
+    monkeypatch.setattr(server._QueryIndex, "_rows", staticmethod(spy))
+    assert await server.list_linkedin_search_queries() == ["python developer_page1"]
+    assert written == []
+
+
+@pytest.mark.asyncio
+async def test_clear_temp_cache_recovers_from_a_broken_index():
+    write_search("python developer")
+    assert await server.list_linkedin_search_queries() == ["python developer_page1"]
+    await server._query_index._db.close()
+    assert await server.clear_temp_cache() == f"Deleted 1 files from {server.TEMP_DIR}."
+    assert await server.list_linkedin_search_queries() == []
@@ -0,0 +1,54 @@
+import asyncio
+import os
+
+import pytest
+
+import server
+
+
+def write_profile(handle, lines=20):
+    path = os.path.join(server.TEMP_DIR, f"{handle}.md")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Profile for {handle}\n" * lines)
+    return path
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    urls = []
+    monkeypatch.setattr("webbrowser.open_new", urls.append)
+    return urls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_of_same_handle_open_one_window(opened):
+    async def addon():
+        await asyncio.sleep(0.3)
+        write_profile("alice")
+
+    first, second, _ = await asyncio.gather(
+        server.scrape_linkedin_profile("alice"),
+        server.scrape_linkedin_profile("alice"),
+        addon(),
+    )
+    assert opened == ["https://www.linkedin.com/in/alice"]
+    assert first == second == "Profile for alice\n" * 20
+    assert server._INFLIGHT == {}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_profile_fails_fast_until_file_appears(opened):
+    file_path = os.path.join(server.TEMP_DIR, "bob.md")
+    url = "https://www.linkedin.com/in/bob"
+    timed_out = await server.open_and_wait_for_file(url, file_path, 20, max_wait=1)
+    assert timed_out.startswith("File not found or incomplete after 1 seconds")
+    assert len(opened) == 1
+
+    fast_fail = await asyncio.wait_for(server.scrape_linkedin_profile("bob"), 0.5)
+    assert fast_fail.startswith("File not found or incomplete in a recent attempt")
+    assert len(opened) == 1
+
+    write_profile("bob")
+    assert await server.scrape_linkedin_profile("bob") == "Profile for bob\n" * 20
+    assert file_path not in server._NEGATIVE
+    assert len(opened) == 1
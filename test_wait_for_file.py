@@ -0,0 +1,127 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+import server
+
+
+def write(path, lines, width=40):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(f"line {i}".ljust(width) + "\n" for i in range(lines)))
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_sees_in_place_overwrite():
+    file_path = os.path.join(server.TEMP_DIR, "carol.md")
+    # Long stale lines, so most of the new file sits before the old size
+    write(file_path, 5, width=200)
+    waiter = asyncio.create_task(server.wait_for_file(file_path, min_lines=20, max_wait=4))
+    await asyncio.sleep(0.3)
+    write(file_path, 30)
+    result = await waiter
+    assert result.startswith("line 0")
+    assert result.count("\n") == 30
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_sees_replace_by_rename():
+    file_path = os.path.join(server.TEMP_DIR, "dave.md")
+    # Long stale lines, so most of the new file sits before the old size
+    write(file_path, 5, width=200)
+    waiter = asyncio.create_task(server.wait_for_file(file_path, min_lines=20, max_wait=4))
+    await asyncio.sleep(0.3)
+    staged = os.path.join(server.TEMP_DIR, "dave.md.partial")
+    write(staged, 30)
+    os.replace(staged, file_path)
+    result = await waiter
+    assert result.count("\n") == 30
+
+
+@pytest.mark.asyncio
+async def test_read_if_complete_counts_bare_carriage_returns():
+    file_path = os.path.join(server.TEMP_DIR, "erin.md")
+    with open(file_path, "wb") as f:
+        f.write(b"\ra\n\r\ra\n\r\r")
+    assert await server._read_if_complete(file_path, 4) == "\na\n\n\na\n\n\n"
+
+
+@pytest.mark.asyncio
+async def test_watcher_stops_when_idle(monkeypatch):
+    monkeypatch.setattr(server, "_WATCHER_IDLE", 0.0)
+    file_path = os.path.join(server.TEMP_DIR, "frank.md")
+    result = await server.wait_for_file(file_path, min_lines=20, max_wait=1)
+    assert result.startswith("File not found")
+    task = server._watcher.start()
+    await asyncio.wait_for(task, timeout=5)
+    assert task.exception() is None
+
+
+@pytest.mark.asyncio
+async def test_read_if_complete_cache_respects_min_lines():
+    file_path = os.path.join(server.TEMP_DIR, "gina.md")
+    write(file_path, 5)
+    assert await server._read_if_complete(file_path, 2) is not None
+    assert await server._read_if_complete(file_path, 20) is None
+    assert await server._read_if_complete(file_path, 5) is not None
+
+
+def write_bytes(name, data):
+    path = os.path.join(server.TEMP_DIR, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_read_if_complete_crlf_split_at_prefix_boundary():
+    # \r is the last byte of the 64KB prefix, \n the first byte after it
+    data = b"a" * (server._HEAD_BYTES - 1) + b"\r\nb\nc\n"
+    file_path = write_bytes("hank.md", data)
+    assert await server._read_if_complete(file_path, 4) is None
+    result = await server._read_if_complete(file_path, 3)
+    assert result == "a" * (server._HEAD_BYTES - 1) + "\nb\nc\n"
+
+
+@pytest.mark.asyncio
+async def test_read_if_complete_long_first_line_needs_full_read():
+    # The prefix holds no newline at all, so only the full read can decide
+    data = b"x" * (server._HEAD_BYTES + 5000) + b"\n" + b"line\n" * 30
+    file_path = write_bytes("ivan.md", data)
+    assert await server._read_if_complete(file_path, 40) is None
+    result = await server._read_if_complete(file_path, 20)
+    assert result == data.decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_read_if_complete_multibyte_char_split_at_prefix_boundary():
+    # The two bytes of "é" straddle the 64KB cut
+    text = "a" * (server._HEAD_BYTES - 1) + "é\n" + "line\n" * 5
+    assert text.encode("utf-8")[server._HEAD_BYTES - 1 : server._HEAD_BYTES + 1] == "é".encode("utf-8")
+    file_path = write_bytes("jane.md", text.encode("utf-8"))
+    assert await server._read_if_complete(file_path, 3) == text
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_recreates_missing_temp_dir():
+    shutil.rmtree(server.TEMP_DIR)
+    file_path = os.path.join(server.TEMP_DIR, "kate.md")
+    waiter = asyncio.create_task(server.wait_for_file(file_path, min_lines=20, max_wait=4))
+    await asyncio.sleep(0.3)
+    os.makedirs(server.TEMP_DIR, exist_ok=True)
+    write(file_path, 30)
+    assert (await waiter).count("\n") == 30
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_falls_back_to_rechecks_when_watcher_fails(monkeypatch):
+    def broken_awatch(*args, **kwargs):
+        raise OSError("inotify watch limit reached")
+
+    monkeypatch.setattr(server, "awatch", broken_awatch)
+    file_path = os.path.join(server.TEMP_DIR, "liam.md")
+    waiter = asyncio.create_task(server.wait_for_file(file_path, min_lines=20, max_wait=4))
+    await asyncio.sleep(0.3)
+    write(file_path, 30)
+    assert (await waiter).count("\n") == 30